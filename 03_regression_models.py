@@ -9,233 +9,258 @@ Tests associations with age, HIV knowledge, partners, STI, and testing behavior.
 import pandas as pd
 import numpy as np
 import statsmodels.api as sm
-from statsmodels.formula.api import logit
+from scipy.stats import chi2
 import warnings
 warnings.filterwarnings('ignore')
 
 # ============================================================================
-# LOAD DATA
+# CONFIGURATION
 # ============================================================================
 
-IN_FILE = '/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/paperB_analytical_dataset.xlsx'
+IN_FILE = '/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/paperB_analytical_dataset.parquet'
 OUT_DIR = '/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/'
+Z_95 = 1.959963984540054  # norm.ppf(0.975), for Wald 95% CIs
 
-print('='*80)
-print('PAPER B: REGRESSION MODELS - CONDOM USE PREDICTORS')
-print('='*80)
-print()
-
-df = pd.read_excel(IN_FILE, engine='openpyxl')
-print(f"Loaded {len(df)} participants")
-print()
-
-# ============================================================================
-# MODEL 1: AGE AND HIV KNOWLEDGE → ALWAYS CONDOM USE
-# ============================================================================
-
-print('='*80)
-print('MODEL 1: Age + HIV Knowledge → Always Condom Use')
-print('='*80)
-print()
-
-# Prepare data
-model1_data = df[['always_condom', 'edad_grupo', 'hiv_knowledge_score']].dropna()
-print(f"Sample size: {len(model1_data)}")
-
-# Fit model
-formula1 = 'always_condom ~ edad_grupo + hiv_knowledge_score'
-model1 = logit(formula1, data=model1_data).fit(disp=False)
-
-print(model1.summary())
-print()
-
-# Extract results
-model1_results = pd.DataFrame({
-    'Variable': model1.params.index,
-    'OR': np.exp(model1.params),
-    'CI_lower': np.exp(model1.conf_int()[0]),
-    'CI_upper': np.exp(model1.conf_int()[1]),
-    'P_value': model1.pvalues,
-    'Coef': model1.params
-})
-print("Odds Ratios:")
-print(model1_results)
-print()
-
-# ============================================================================
-# MODEL 2: ADD NUMBER OF PARTNERS
-# ============================================================================
-
-print('='*80)
-print('MODEL 2: Age + Knowledge + Number of Partners → Always Condom Use')
-print('='*80)
-print()
-
-model2_data = df[['always_condom', 'edad_grupo', 'hiv_knowledge_score', 
-                   'partners_last_year']].dropna()
-print(f"Sample size: {len(model2_data)}")
-
-formula2 = 'always_condom ~ edad_grupo + hiv_knowledge_score + partners_last_year'
-model2 = logit(formula2, data=model2_data).fit(disp=False)
-
-print(model2.summary())
-print()
-
-model2_results = pd.DataFrame({
-    'Variable': model2.params.index,
-    'OR': np.exp(model2.params),
-    'CI_lower': np.exp(model2.conf_int()[0]),
-    'CI_upper': np.exp(model2.conf_int()[1]),
-    'P_value': model2.pvalues,
-    'Coef': model2.params
-})
-print("Odds Ratios:")
-print(model2_results)
-print()
-
-# ============================================================================
-# MODEL 3: ADD STI DIAGNOSIS AND HIV TESTING
-# ============================================================================
-
-print('='*80)
-print('MODEL 3: Full Model with STI and Testing Variables')
-print('='*80)
-print()
-
-model3_data = df[['always_condom', 'edad_grupo', 'hiv_knowledge_score', 
-                   'partners_last_year', 'any_sti', 'tested_hiv_12mo']].dropna()
-print(f"Sample size: {len(model3_data)}")
-
-formula3 = '''always_condom ~ edad_grupo + hiv_knowledge_score + 
-              partners_last_year + any_sti + tested_hiv_12mo'''
-model3 = logit(formula3, data=model3_data).fit(disp=False)
-
-print(model3.summary())
-print()
-
-model3_results = pd.DataFrame({
-    'Variable': model3.params.index,
-    'OR': np.exp(model3.params),
-    'CI_lower': np.exp(model3.conf_int()[0]),
-    'CI_upper': np.exp(model3.conf_int()[1]),
-    'P_value': model3.pvalues,
-    'Coef': model3.params
-})
-print("Odds Ratios:")
-print(model3_results)
-print()
 
 # ============================================================================
-# MODEL 4: ADD PREP AWARENESS
+# HELPERS
 # ============================================================================
 
-print('='*80)
-print('MODEL 4: Full Model + PrEP Awareness')
-print('='*80)
-print()
-
-model4_data = df[['always_condom', 'edad_grupo', 'hiv_knowledge_score', 
-                   'partners_last_year', 'any_sti', 'tested_hiv_12mo',
-                   'knows_prep']].dropna()
-print(f"Sample size: {len(model4_data)}")
-
-formula4 = '''always_condom ~ edad_grupo + hiv_knowledge_score + 
-              partners_last_year + any_sti + tested_hiv_12mo + knows_prep'''
-model4 = logit(formula4, data=model4_data).fit(disp=False)
-
-print(model4.summary())
-print()
-
-model4_results = pd.DataFrame({
-    'Variable': model4.params.index,
-    'OR': np.exp(model4.params),
-    'CI_lower': np.exp(model4.conf_int()[0]),
-    'CI_upper': np.exp(model4.conf_int()[1]),
-    'P_value': model4.pvalues,
-    'Coef': model4.params
-})
-print("Odds Ratios:")
-print(model4_results)
-print()
-
-# ============================================================================
-# MODEL 5: AGE INTERACTION WITH HIV KNOWLEDGE
-# ============================================================================
-
-print('='*80)
-print('MODEL 5: Age × HIV Knowledge Interaction')
-print('='*80)
-print()
-
-model5_data = df[['always_condom', 'edad_grupo', 'hiv_knowledge_score', 
-                   'partners_last_year']].dropna()
-print(f"Sample size: {len(model5_data)}")
-
-formula5 = '''always_condom ~ edad_grupo + hiv_knowledge_score + 
-              partners_last_year + edad_grupo:hiv_knowledge_score'''
-model5 = logit(formula5, data=model5_data).fit(disp=False)
-
-print(model5.summary())
-print()
-
-model5_results = pd.DataFrame({
-    'Variable': model5.params.index,
-    'OR': np.exp(model5.params),
-    'CI_lower': np.exp(model5.conf_int()[0]),
-    'CI_upper': np.exp(model5.conf_int()[1]),
-    'P_value': model5.pvalues,
-    'Coef': model5.params
-})
-print("Odds Ratios:")
-print(model5_results)
-print()
-
-# Test interaction significance
-lr_test = -2 * (model2.llf - model5.llf)
-from scipy.stats import chi2
-p_interaction = 1 - chi2.cdf(lr_test, 1)
-print(f"Likelihood ratio test for interaction:")
-print(f"  χ² = {lr_test:.2f}, p = {p_interaction:.4f}")
-print()
-
-# ============================================================================
-# AGE-STRATIFIED MODELS
-# ============================================================================
-
-print('='*80)
-print('AGE-STRATIFIED MODELS')
-print('='*80)
-print()
-
-age_stratified_results = []
-
-age_groups = df['edad_grupo_lbl'].unique()
-age_groups = sorted([a for a in age_groups if pd.notna(a)])
-
-for age in age_groups:
-    age_data = df[df['edad_grupo_lbl'] == age][['always_condom', 
-                                                  'hiv_knowledge_score',
-                                                  'partners_last_year']].dropna()
-    
-    if len(age_data) >= 30:  # Minimum sample size
-        formula_age = 'always_condom ~ hiv_knowledge_score + partners_last_year'
-        model_age = logit(formula_age, data=age_data).fit(disp=False)
-        
+def _fit_logit(y, X, start_params=None):
+    """Newton-Raphson logit fit, falling back to BFGS if the Hessian is singular."""
+    model = sm.Logit(y, X)
+    try:
+        return model.fit(start_params=start_params, method='newton', disp=False)
+    except np.linalg.LinAlgError:
+        return model.fit(start_params=start_params, method='bfgs', maxiter=200, disp=False)
+
+
+def _or_frame(res):
+    """Odds ratios, 95% CIs and p-values for a fitted logit, one row per term."""
+    p = res.params.to_numpy()
+    half_width = Z_95 * res.bse.to_numpy()
+    exp_ci = np.exp(np.column_stack([p - half_width, p + half_width]))
+    return pd.DataFrame({
+        'Variable': res.params.index,
+        'OR': np.exp(p),
+        'CI_lower': exp_ci[:, 0],
+        'CI_upper': exp_ci[:, 1],
+        'P_value': res.pvalues.to_numpy(),
+        'Coef': p
+    }, index=res.params.index)
+
+
+def main(df=None):
+    """Fit the regression models.
+
+    `df` is the analytical dataset; it is read from IN_FILE if not given.
+    """
+    # ============================================================================
+    # LOAD DATA
+    # ============================================================================
+
+    print('='*80)
+    print('PAPER B: REGRESSION MODELS - CONDOM USE PREDICTORS')
+    print('='*80)
+    print()
+
+    if df is None:
+        df = pd.read_parquet(IN_FILE)
+    print(f"Loaded {len(df)} participants")
+    print()
+
+    # Outcome and full design matrix, built once; each model uses a subset of columns
+    predictors = ['edad_grupo', 'hiv_knowledge_score', 'partners_last_year',
+                  'any_sti', 'tested_hiv_12mo', 'knows_prep']
+    design = pd.DataFrame(
+        df[['always_condom'] + predictors].to_numpy(dtype=np.float64, na_value=np.nan),
+        columns=['always_condom'] + predictors)
+    y = design.pop('always_condom')
+    X_full = design
+    X_full.insert(0, 'Intercept', 1.0)
+    X_full['edad_grupo:hiv_knowledge_score'] = X_full['edad_grupo'] * X_full['hiv_knowledge_score']
+    # Single NaN scan; each model's complete-case mask is a column subset of this
+    complete = X_full.notna() & y.notna().to_numpy()[:, None]
+
+    # ============================================================================
+    # MODEL 1: AGE AND HIV KNOWLEDGE → ALWAYS CONDOM USE
+    # ============================================================================
+
+    print('='*80)
+    print('MODEL 1: Age + HIV Knowledge → Always Condom Use')
+    print('='*80)
+    print()
+
+    # Prepare data
+    cols1 = ['Intercept', 'edad_grupo', 'hiv_knowledge_score']
+    mask1 = complete[cols1].all(axis=1)
+    print(f"Sample size: {mask1.sum()}")
+
+    # Fit model
+    model1 = _fit_logit(y[mask1], X_full.loc[mask1, cols1])
+
+    print(model1.summary())
+    print()
+
+    # Extract results
+    model1_results = _or_frame(model1)
+    print("Odds Ratios:")
+    print(model1_results)
+    print()
+
+    # ============================================================================
+    # MODEL 2: ADD NUMBER OF PARTNERS
+    # ============================================================================
+
+    print('='*80)
+    print('MODEL 2: Age + Knowledge + Number of Partners → Always Condom Use')
+    print('='*80)
+    print()
+
+    cols2 = cols1 + ['partners_last_year']
+    mask2 = complete[cols2].all(axis=1)
+    print(f"Sample size: {mask2.sum()}")
+
+    # Warm start from Model 1 (new coefficient starts at 0)
+    model2 = _fit_logit(y[mask2], X_full.loc[mask2, cols2],
+                        start_params=np.r_[model1.params, 0])
+
+    print(model2.summary())
+    print()
+
+    model2_results = _or_frame(model2)
+    print("Odds Ratios:")
+    print(model2_results)
+    print()
+
+    # ============================================================================
+    # MODEL 3: ADD STI DIAGNOSIS AND HIV TESTING
+    # ============================================================================
+
+    print('='*80)
+    print('MODEL 3: Full Model with STI and Testing Variables')
+    print('='*80)
+    print()
+
+    cols3 = cols2 + ['any_sti', 'tested_hiv_12mo']
+    mask3 = complete[cols3].all(axis=1)
+    print(f"Sample size: {mask3.sum()}")
+
+    model3 = _fit_logit(y[mask3], X_full.loc[mask3, cols3],
+                        start_params=np.r_[model2.params, 0, 0])
+
+    print(model3.summary())
+    print()
+
+    model3_results = _or_frame(model3)
+    print("Odds Ratios:")
+    print(model3_results)
+    print()
+
+    # ============================================================================
+    # MODEL 4: ADD PREP AWARENESS
+    # ============================================================================
+
+    print('='*80)
+    print('MODEL 4: Full Model + PrEP Awareness')
+    print('='*80)
+    print()
+
+    cols4 = cols3 + ['knows_prep']
+    mask4 = complete[cols4].all(axis=1)
+    print(f"Sample size: {mask4.sum()}")
+
+    model4 = _fit_logit(y[mask4], X_full.loc[mask4, cols4],
+                        start_params=np.r_[model3.params, 0])
+
+    print(model4.summary())
+    print()
+
+    model4_results = _or_frame(model4)
+    or_map = model4_results.set_index('Variable')['OR'].to_dict()
+    print("Odds Ratios:")
+    print(model4_results)
+    print()
+
+    # ============================================================================
+    # MODEL 5: AGE INTERACTION WITH HIV KNOWLEDGE
+    # ============================================================================
+
+    print('='*80)
+    print('MODEL 5: Age × HIV Knowledge Interaction')
+    print('='*80)
+    print()
+
+    cols5 = cols2 + ['edad_grupo:hiv_knowledge_score']
+    mask5 = complete[cols5].all(axis=1)
+    print(f"Sample size: {mask5.sum()}")
+
+    model5 = _fit_logit(y[mask5], X_full.loc[mask5, cols5],
+                        start_params=np.r_[model2.params, 0])
+
+    print(model5.summary())
+    print()
+
+    model5_results = _or_frame(model5)
+    print("Odds Ratios:")
+    print(model5_results)
+    print()
+
+    # Test interaction significance
+    lr_test = -2 * (model2.llf - model5.llf)
+    p_interaction = chi2.sf(lr_test, len(model5.params) - len(model2.params))
+    print(f"Likelihood ratio test for interaction:")
+    print(f"  χ² = {lr_test:.2f}, p = {p_interaction:.4f}")
+    print()
+
+    # ============================================================================
+    # AGE-STRATIFIED MODELS
+    # ============================================================================
+
+    print('='*80)
+    print('AGE-STRATIFIED MODELS')
+    print('='*80)
+    print()
+
+    age_stratified_results = []
+
+    # One fully interacted fit (group-specific intercept and slopes) instead of
+    # one fit per age group. The log-likelihood separates by group, so the
+    # estimates and standard errors equal those of the separate models.
+    strat_vars = ['hiv_knowledge_score', 'partners_last_year']
+    age_data = df[['edad_grupo_lbl', 'always_condom'] + strat_vars].dropna()
+    age_n = age_data['edad_grupo_lbl'].value_counts()
+    age_groups = [a for a in age_data['edad_grupo_lbl'].cat.categories
+                  if age_n[a] >= 30]  # Minimum sample size
+
+    # Group membership from the integer category codes, in one pass
+    group_codes = age_data['edad_grupo_lbl'].cat.categories.get_indexer(age_groups)
+    group_dummies = (age_data['edad_grupo_lbl'].cat.codes.to_numpy()[:, None]
+                     == group_codes[None, :])
+    in_model = group_dummies.any(axis=1)
+    age_data, group_dummies = age_data[in_model], group_dummies[in_model]
+
+    base = np.column_stack([np.ones(len(age_data))] +
+                           [age_data[v].to_numpy(dtype=np.float64) for v in strat_vars])
+    X_age = (group_dummies[:, :, None] * base[:, None, :]).reshape(len(age_data), -1)
+    age_terms = [f'{age}:{term}' for age in age_groups
+                 for term in ['Intercept'] + strat_vars]
+    model_age = _fit_logit(age_data['always_condom'].to_numpy(dtype=np.float64),
+                           pd.DataFrame(X_age, columns=age_terms))
+    age_or = _or_frame(model_age)
+
+    for age in age_groups:
         # Extract knowledge OR
-        knowledge_or = np.exp(model_age.params['hiv_knowledge_score'])
-        knowledge_ci_lower = np.exp(model_age.conf_int().loc['hiv_knowledge_score', 0])
-        knowledge_ci_upper = np.exp(model_age.conf_int().loc['hiv_knowledge_score', 1])
-        knowledge_p = model_age.pvalues['hiv_knowledge_score']
-        
+        (knowledge_or, knowledge_ci_lower, knowledge_ci_upper,
+         knowledge_p) = age_or.loc[f'{age}:hiv_knowledge_score', ['OR', 'CI_lower', 'CI_upper', 'P_value']]
+
         # Extract partners OR
-        partners_or = np.exp(model_age.params['partners_last_year'])
-        partners_ci_lower = np.exp(model_age.conf_int().loc['partners_last_year', 0])
-        partners_ci_upper = np.exp(model_age.conf_int().loc['partners_last_year', 1])
-        partners_p = model_age.pvalues['partners_last_year']
-        
+        (partners_or, partners_ci_lower, partners_ci_upper,
+         partners_p) = age_or.loc[f'{age}:partners_last_year', ['OR', 'CI_lower', 'CI_upper', 'P_value']]
+
         age_stratified_results.append({
             'Age_Group': age,
-            'N': len(age_data),
+            'N': int(age_n[age]),
             'Knowledge_OR': knowledge_or,
             'Knowledge_CI_lower': knowledge_ci_lower,
             'Knowledge_CI_upper': knowledge_ci_upper,
@@ -245,77 +270,83 @@ for age in age_groups:
             'Partners_CI_upper': partners_ci_upper,
             'Partners_P': partners_p
         })
-        
-        print(f"\n{age} (N={len(age_data)}):")
+
+        print(f"\n{age} (N={age_n[age]}):")
         print(f"  HIV Knowledge: OR={knowledge_or:.3f} (95% CI: {knowledge_ci_lower:.3f}-{knowledge_ci_upper:.3f}), p={knowledge_p:.4f}")
         print(f"  Partners: OR={partners_or:.3f} (95% CI: {partners_ci_lower:.3f}-{partners_ci_upper:.3f}), p={partners_p:.4f}")
 
-age_strat_df = pd.DataFrame(age_stratified_results)
-print()
-
-# ============================================================================
-# SAVE ALL RESULTS
-# ============================================================================
-
-print('='*80)
-print('SAVING RESULTS')
-print('='*80)
-print()
-
-with pd.ExcelWriter(OUT_DIR + 'paperB_regression_models.xlsx', 
-                    engine='openpyxl') as writer:
-    
-    model1_results.to_excel(writer, sheet_name='Model1_Age_Knowledge', index=False)
-    print("  Saved: Model 1 (Age + Knowledge)")
-    
-    model2_results.to_excel(writer, sheet_name='Model2_Add_Partners', index=False)
-    print("  Saved: Model 2 (Add Partners)")
-    
-    model3_results.to_excel(writer, sheet_name='Model3_Add_STI_Testing', index=False)
-    print("  Saved: Model 3 (Add STI + Testing)")
-    
-    model4_results.to_excel(writer, sheet_name='Model4_Add_PrEP', index=False)
-    print("  Saved: Model 4 (Add PrEP)")
-    
-    model5_results.to_excel(writer, sheet_name='Model5_Interaction', index=False)
-    print("  Saved: Model 5 (Age × Knowledge)")
-    
-    age_strat_df.to_excel(writer, sheet_name='Age_Stratified', index=False)
-    print("  Saved: Age-stratified models")
-    
-    # Model comparison summary
-    model_comparison = pd.DataFrame({
-        'Model': ['Model 1', 'Model 2', 'Model 3', 'Model 4', 'Model 5'],
-        'Variables': [
-            'Age + Knowledge',
-            'Age + Knowledge + Partners',
-            'Age + Knowledge + Partners + STI + Testing',
-            'Age + Knowledge + Partners + STI + Testing + PrEP',
-            'Age + Knowledge + Partners + Age×Knowledge'
-        ],
-        'N': [len(model1_data), len(model2_data), len(model3_data), 
-              len(model4_data), len(model5_data)],
-        'Log_Likelihood': [model1.llf, model2.llf, model3.llf, model4.llf, model5.llf],
-        'AIC': [model1.aic, model2.aic, model3.aic, model4.aic, model5.aic],
-        'BIC': [model1.bic, model2.bic, model3.bic, model4.bic, model5.bic],
-        'Pseudo_R2': [model1.prsquared, model2.prsquared, model3.prsquared, 
-                      model4.prsquared, model5.prsquared]
-    })
-    model_comparison.to_excel(writer, sheet_name='Model_Comparison', index=False)
-    print("  Saved: Model comparison")
-
-print()
-print('='*80)
-print('REGRESSION MODELS COMPLETE')
-print('='*80)
-print()
-print(f"Results saved to: {OUT_DIR}paperB_regression_models.xlsx")
-print()
-print("KEY FINDINGS:")
-print(f"  - HIV knowledge effect on condom use: OR = {model4_results[model4_results['Variable']=='hiv_knowledge_score']['OR'].values[0]:.3f}")
-print(f"  - Partners effect: OR = {model4_results[model4_results['Variable']=='partners_last_year']['OR'].values[0]:.3f}")
-print(f"  - Age effect: OR = {model4_results[model4_results['Variable']=='edad_grupo']['OR'].values[0]:.3f}")
-if 'tested_hiv_12mo' in model4_results['Variable'].values:
-    print(f"  - Testing effect: OR = {model4_results[model4_results['Variable']=='tested_hiv_12mo']['OR'].values[0]:.3f}")
-if 'knows_prep' in model4_results['Variable'].values:
-    print(f"  - PrEP awareness: OR = {model4_results[model4_results['Variable']=='knows_prep']['OR'].values[0]:.3f}")
+    age_strat_df = pd.DataFrame(age_stratified_results)
+    print()
+
+    # ============================================================================
+    # SAVE ALL RESULTS
+    # ============================================================================
+
+    print('='*80)
+    print('SAVING RESULTS')
+    print('='*80)
+    print()
+
+    # xlsxwriter's constant_memory mode is not used: pandas writes cells
+    # column by column, which that mode silently drops
+    with pd.ExcelWriter(OUT_DIR + 'paperB_regression_models.xlsx', 
+                        engine='xlsxwriter') as writer:
+
+        model1_results.to_excel(writer, sheet_name='Model1_Age_Knowledge', index=False)
+        print("  Saved: Model 1 (Age + Knowledge)")
+
+        model2_results.to_excel(writer, sheet_name='Model2_Add_Partners', index=False)
+        print("  Saved: Model 2 (Add Partners)")
+
+        model3_results.to_excel(writer, sheet_name='Model3_Add_STI_Testing', index=False)
+        print("  Saved: Model 3 (Add STI + Testing)")
+
+        model4_results.to_excel(writer, sheet_name='Model4_Add_PrEP', index=False)
+        print("  Saved: Model 4 (Add PrEP)")
+
+        model5_results.to_excel(writer, sheet_name='Model5_Interaction', index=False)
+        print("  Saved: Model 5 (Age × Knowledge)")
+
+        age_strat_df.to_excel(writer, sheet_name='Age_Stratified', index=False)
+        print("  Saved: Age-stratified models")
+
+        # Model comparison summary
+        model_comparison = pd.DataFrame({
+            'Model': ['Model 1', 'Model 2', 'Model 3', 'Model 4', 'Model 5'],
+            'Variables': [
+                'Age + Knowledge',
+                'Age + Knowledge + Partners',
+                'Age + Knowledge + Partners + STI + Testing',
+                'Age + Knowledge + Partners + STI + Testing + PrEP',
+                'Age + Knowledge + Partners + Age×Knowledge'
+            ],
+            'N': [int(model1.nobs), int(model2.nobs), int(model3.nobs), 
+                  int(model4.nobs), int(model5.nobs)],
+            'Log_Likelihood': [model1.llf, model2.llf, model3.llf, model4.llf, model5.llf],
+            'AIC': [model1.aic, model2.aic, model3.aic, model4.aic, model5.aic],
+            'BIC': [model1.bic, model2.bic, model3.bic, model4.bic, model5.bic],
+            'Pseudo_R2': [model1.prsquared, model2.prsquared, model3.prsquared, 
+                          model4.prsquared, model5.prsquared]
+        })
+        model_comparison.to_excel(writer, sheet_name='Model_Comparison', index=False)
+        print("  Saved: Model comparison")
+
+    print()
+    print('='*80)
+    print('REGRESSION MODELS COMPLETE')
+    print('='*80)
+    print()
+    print(f"Results saved to: {OUT_DIR}paperB_regression_models.xlsx")
+    print()
+    print("KEY FINDINGS:")
+    print(f"  - HIV knowledge effect on condom use: OR = {or_map['hiv_knowledge_score']:.3f}")
+    print(f"  - Partners effect: OR = {or_map['partners_last_year']:.3f}")
+    print(f"  - Age effect: OR = {or_map['edad_grupo']:.3f}")
+    if 'tested_hiv_12mo' in or_map:
+        print(f"  - Testing effect: OR = {or_map['tested_hiv_12mo']:.3f}")
+    if 'knows_prep' in or_map:
+        print(f"  - PrEP awareness: OR = {or_map['knows_prep']:.3f}")
+
+
+if __name__ == '__main__':
+    main()
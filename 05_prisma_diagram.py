@@ -6,16 +6,93 @@ Creates a PRISMA-style flow diagram showing participant selection
 from initial ENSSEX sample to final analysis sample.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')  # Files only, no interactive backend
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.transforms import Bbox
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # OSError: package present but libcairo missing
+    cairosvg = None
+
+OUT_DIR = '/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/'
+PNG_DPI = 150
+MAKE_SIMPLE = os.environ.get('PRISMA_SIMPLE', '0') == '1'  # Also draw the simplified view
+
+# Crop boxes (inches) as measured by bbox_inches='tight' for these layouts, i.e.
+# fig.get_tightbbox() padded by 0.1 in. Passing them directly avoids the extra
+# draw pass 'tight' needs, but they depend on the box texts, the fonts and the
+# subplots_adjust margins: after changing any of those, run once with
+# PRISMA_MEASURE_BBOX=1, which crops to the measured box and prints it, and
+# paste the printed values here.
+MEASURE_BBOX = os.environ.get('PRISMA_MEASURE_BBOX', '0') == '1'
+DETAILED_BBOX = Bbox.from_extents(0.05, -0.0831, 11.95, 13.82)
+SIMPLE_BBOX = Bbox.from_extents(0.05, 0.05, 9.95, 11.74)
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def draw_boxes(ax, boxes):
+    """Draw (x, y, text, text_kwargs) boxes in one pass."""
+    for x, y, text, kwargs in boxes:
+        ax.text(x, y, text, **kwargs)
+
+
+def draw_arrows(ax, arrows):
+    """Draw straight ((x0, y0), (x1, y1), (color, linewidth)) arrows.
+
+    Shafts go into one LineCollection and heads into one scatter per
+    direction, instead of one FancyArrowPatch per arrow.
+    """
+    starts = np.array([start for start, _, _ in arrows], dtype=float)
+    ends = np.array([end for _, end, _ in arrows], dtype=float)
+    colors = [color for _, _, (color, _) in arrows]
+    widths = np.array([lw for _, _, (_, lw) in arrows], dtype=float)
+    ax.add_collection(LineCollection(np.stack([starts, ends], axis=1),
+                                     colors=colors, linewidths=widths, zorder=4))
+    d = ends - starts
+    markers = np.where(np.abs(d[:, 0]) > np.abs(d[:, 1]),
+                       np.where(d[:, 0] > 0, '>', '<'),
+                       np.where(d[:, 1] > 0, '^', 'v'))
+    for marker in np.unique(markers):
+        sel = markers == marker
+        ax.scatter(ends[sel, 0], ends[sel, 1], marker=marker, s=(3.5 * widths[sel]) ** 2,
+                   c=[colors[i] for i in np.flatnonzero(sel)], linewidths=0, zorder=4)
+
+
+def save_png(fig, path, bbox):
+    """Save fig cropped to bbox (inches) as a PNG.
+
+    With cairosvg available the figure is written once as SVG and
+    rasterized by Cairo; otherwise Agg renders the PNG directly.
+    """
+    if MEASURE_BBOX:
+        bbox = fig.get_tightbbox().padded(0.1)
+        print(f"{os.path.basename(path)}: Bbox.from_extents("
+              f"{', '.join(f'{v:.4g}' for v in bbox.extents)})")
+    if cairosvg is None:
+        fig.canvas.print_figure(path, dpi=PNG_DPI, bbox_inches=bbox, facecolor='white',
+                                pil_kwargs={'compress_level': 1})
+        return
+    svg = io.BytesIO()
+    fig.savefig(svg, format='svg', bbox_inches=bbox, facecolor='white')
+    cairosvg.svg2png(bytestring=svg.getvalue(), write_to=path,
+                     output_width=round(bbox.width * PNG_DPI))
 
-# Set up figure
-fig, ax = plt.subplots(figsize=(12, 14))
-ax.set_xlim(0, 10)
-ax.set_ylim(0, 16)
-ax.axis('off')
+
+# =============================================================================
+# STYLES
+# =============================================================================
 
 # Define colors
 box_color = '#E8F4F8'
@@ -30,261 +107,326 @@ box_props = dict(boxstyle=box_style, facecolor=box_color, edgecolor='#2C3E50', l
 exclude_props = dict(boxstyle=box_style, facecolor=exclude_color, edgecolor='#C0392B', linewidth=2)
 final_props = dict(boxstyle=box_style, facecolor=final_color, edgecolor='#27AE60', linewidth=3)
 
-# Arrow properties
-arrow_props = dict(arrowstyle='->', lw=2.5, color=arrow_color)
-
-# =============================================================================
-# ENROLLMENT
-# =============================================================================
-
-y_pos = 15
+# Arrow styles for draw_arrows: (color, linewidth)
+down_arrow = (arrow_color, 2.5)
+exclude_arrow = ('#C0392B', 1.5)
+final_arrow = ('#27AE60', 3)
 
-# Initial enrollment box
-enrollment_text = "ENSSEX National Survey 2024\nTotal participants enrolled\nn = 20,392"
-ax.text(5, y_pos, enrollment_text, ha='center', va='center', fontsize=13, 
-        fontweight='bold', bbox=box_props, color=text_color)
+# Font shared by both monospace boxes (saves repeating the family/size keywords)
+mono_font = FontProperties(family='monospace', size=10)
 
-# Arrow down
-ax.annotate('', xy=(5, y_pos-1), xytext=(5, y_pos-0.5),
-            arrowprops=arrow_props)
 
 # =============================================================================
-# SCREENING 1: SEXUAL ACTIVITY
+# BOX TEXT
 # =============================================================================
 
-y_pos = 13
-
-# Sexually active assessment box
-screening1_text = "Assessed for sexual activity\nin last 12 months"
-ax.text(5, y_pos, screening1_text, ha='center', va='center', fontsize=12,
-        bbox=box_props, color=text_color)
+# Detailed diagram
+DETAILED_TITLE = 'PRISMA Flow Diagram: Participant Selection for PaperB\nCondom Use Correlates Analysis'
+ENROLLMENT_TEXT = "ENSSEX National Survey 2024\nTotal participants enrolled\nn = 20,392"
+SCREENING1_TEXT = "Assessed for sexual activity\nin last 12 months"
+EXCLUDE1_TEXT = "Excluded: No sexual partners\nin last year (P71 = 0 or missing)\nn = 7,517"
+REMAINING1_TEXT = "Sexually active participants\nn = 12,875"
+EXCLUDE2_TEXT = "Excluded: Missing or invalid\ncondom use data (P73)\nn = 110"
+REMAINING2_TEXT = "Valid condom use data\nn = 12,765"
+EXCLUDE3_TEXT = "Excluded: Missing age data\nn = 0"
+FINAL_TEXT = "FINAL ANALYTICAL SAMPLE\nn = 12,765\n(62.6% of total enrolled)"
 
-# Arrow down
-ax.annotate('', xy=(5, y_pos-1), xytext=(5, y_pos-0.5),
-            arrowprops=arrow_props)
+CHARACTERISTICS_TEXT = """SAMPLE CHARACTERISTICS
 
-# Exclusion box 1
-exclude1_text = "Excluded: No sexual partners\nin last year (P71 = 0 or missing)\nn = 7,517"
-ax.text(8.5, y_pos, exclude1_text, ha='center', va='center', fontsize=11,
-        bbox=exclude_props, color='#C0392B')
+Demographics:
+• Age: 18-89 years (median: 40 years)
+• Age groups: 18-29 (26%), 30-39 (23%), 40-49 (18%),
+  50-59 (16%), 60-69 (11%), 70-79 (5%), 80+ (1%)
 
-# Arrow to exclusion
-ax.annotate('', xy=(8.5, y_pos), xytext=(6, y_pos),
-            arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
+Condom Use:
+• Always: 2,236 (17.5%)
+• Sometimes: 2,620 (20.5%)
+• Never: 7,909 (62.0%)
 
-# =============================================================================
-# SCREENING 2: CONDOM USE DATA
-# =============================================================================
+Sexual Partners (last year):
+• Mean: 1.50 partners (SD = 1.47)
+• Multiple partners (≥2): 2,234 (17.4%)
 
-y_pos = 11
+HIV Knowledge & Testing:
+• Mean knowledge score: 4.31/6 (SD = 1.45)
+• Tested HIV (12mo): 4,004 (31.4%)
+• PrEP awareness: 1,971 (15.4%)
 
-# After sexual activity filter
-remaining1_text = "Sexually active participants\nn = 12,875"
-ax.text(5, y_pos, remaining1_text, ha='center', va='center', fontsize=12,
-        bbox=box_props, color=text_color)
+STI Diagnosis:
+• Any STI: 885 (6.9%)"""
 
-# Arrow down
-ax.annotate('', xy=(5, y_pos-1), xytext=(5, y_pos-0.5),
-            arrowprops=arrow_props)
+EXCLUSION_SUMMARY = """TOTAL EXCLUSIONS: 7,627 (37.4%)
+• No sexual activity: 7,517 (36.9%)
+• Missing condom data: 110 (0.5%)
+• Missing age: 0 (0.0%)"""
 
-# Exclusion box 2
-exclude2_text = "Excluded: Missing or invalid\ncondom use data (P73)\nn = 110"
-ax.text(8.5, y_pos, exclude2_text, ha='center', va='center', fontsize=11,
-        bbox=exclude_props, color='#C0392B')
+PRISMA_NOTE = 'Based on PRISMA 2020 guidelines for reporting systematic reviews'
 
-# Arrow to exclusion
-ax.annotate('', xy=(8.5, y_pos), xytext=(6, y_pos),
-            arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
+# Simplified view
+SIMPLE_TITLE = 'PaperB Participant Flow: Simplified View'
+SIMPLE_ENROLLMENT_TEXT = "Total ENSSEX participants\nn = 20,392"
+SIMPLE_SCREEN1_TEXT = "Sexually active in last year\n(P71 > 0)\nn = 12,875 (63.1%)"
+SIMPLE_EXCLUDE1_TEXT = "Excluded\nn = 7,517\n(36.9%)"
+SIMPLE_SCREEN2_TEXT = "Valid condom use data\n(P73 = 1, 2, or 3)\nn = 12,765 (62.6%)"
+SIMPLE_EXCLUDE2_TEXT = "Excluded\nn = 110\n(0.5%)"
+SIMPLE_SCREEN3_TEXT = "Valid age data\nn = 12,765 (62.6%)"
+SIMPLE_EXCLUDE3_TEXT = "Excluded\nn = 0\n(0.0%)"
+SIMPLE_FINAL_TEXT = "FINAL ANALYTICAL SAMPLE\nn = 12,765\n62.6% retention"
 
-# =============================================================================
-# SCREENING 3: AGE DATA
-# =============================================================================
+BREAKDOWN_TEXT = """AVAILABLE DATA FOR ANALYSES:
 
-y_pos = 9
+• Bivariate associations: n = 12,765 (100%)
+• Regression Model 1-2: n = 12,765 (100%)
+• Regression Model 3 (+ STI): n = 12,513 (98.0%)
+• Regression Model 4 (+ PrEP): n = 11,806 (92.5%)
+• Age-stratified models: n = 12,765 (by age group)"""
 
-# After condom use filter
-remaining2_text = "Valid condom use data\nn = 12,765"
-ax.text(5, y_pos, remaining2_text, ha='center', va='center', fontsize=12,
-        bbox=box_props, color=text_color)
 
-# Arrow down
-ax.annotate('', xy=(5, y_pos-1), xytext=(5, y_pos-0.5),
-            arrowprops=arrow_props)
+def render_detailed():
+    """Draw and save the detailed PRISMA flow diagram; return the PNG path."""
+    fig = Figure(figsize=(12, 14))
+    FigureCanvasAgg(fig)  # No pyplot: the figure is only ever written to file
+    ax = fig.add_subplot()
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 16)
+    ax.axis('off')
 
-# Exclusion box 3
-exclude3_text = "Excluded: Missing age data\nn = 0"
-ax.text(8.5, y_pos, exclude3_text, ha='center', va='center', fontsize=11,
-        bbox=exclude_props, color='#C0392B')
+    # Text styles shared by every box of the same kind
+    box_text = dict(ha='center', va='center', fontsize=12, bbox=box_props, color=text_color)
+    exclude_text = dict(ha='center', va='center', fontsize=11, bbox=exclude_props, color='#C0392B')
 
-# Arrow to exclusion
-ax.annotate('', xy=(8.5, y_pos), xytext=(6, y_pos),
-            arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
+    # Boxes and arrows are collected per section and drawn together at the end
+    boxes = []   # (x, y, text, text kwargs)
+    arrows = []  # ((x0, y0), (x1, y1), (color, linewidth))
 
-# =============================================================================
-# FINAL SAMPLE FOR ANALYSIS
-# =============================================================================
+    # =============================================================================
+    # ENROLLMENT
+    # =============================================================================
 
-y_pos = 7
+    y_pos = 15
 
-# Final analytical sample
-final_text = "FINAL ANALYTICAL SAMPLE\nn = 12,765\n(62.6% of total enrolled)"
-ax.text(5, y_pos, final_text, ha='center', va='center', fontsize=13,
-        fontweight='bold', bbox=final_props, color='#27AE60')
+    # Initial enrollment box
+    boxes.append((5, y_pos, ENROLLMENT_TEXT,
+                  dict(box_text, fontsize=13, fontweight='bold')))
 
-# Arrow down
-ax.annotate('', xy=(5, y_pos-1), xytext=(5, y_pos-0.5),
-            arrowprops=dict(arrowstyle='->', lw=3, color='#27AE60'))
+    # Arrow down
+    arrows.append(((5, y_pos-0.5), (5, y_pos-1), down_arrow))
 
-# =============================================================================
-# SAMPLE CHARACTERISTICS
-# =============================================================================
+    # =============================================================================
+    # SCREENING 1: SEXUAL ACTIVITY
+    # =============================================================================
 
-y_pos = 5
+    y_pos = 13
 
-# Sample characteristics box
-characteristics_text = """SAMPLE CHARACTERISTICS
+    # Sexually active assessment box
+    boxes.append((5, y_pos, SCREENING1_TEXT, box_text))
 
-Demographics:
-• Age: 18-89 years (median: 40 years)
-• Age groups: 18-29 (26%), 30-39 (23%), 40-49 (18%),
-  50-59 (16%), 60-69 (11%), 70-79 (5%), 80+ (1%)
+    # Arrow down
+    arrows.append(((5, y_pos-0.5), (5, y_pos-1), down_arrow))
 
-Condom Use:
-• Always: 2,236 (17.5%)
-• Sometimes: 2,620 (20.5%)
-• Never: 7,909 (62.0%)
+    # Exclusion box 1
+    boxes.append((8.5, y_pos, EXCLUDE1_TEXT, exclude_text))
 
-Sexual Partners (last year):
-• Mean: 1.50 partners (SD = 1.47)
-• Multiple partners (≥2): 2,234 (17.4%)
+    # Arrow to exclusion
+    arrows.append(((6, y_pos), (8.5, y_pos), exclude_arrow))
 
-HIV Knowledge & Testing:
-• Mean knowledge score: 4.31/6 (SD = 1.45)
-• Tested HIV (12mo): 4,004 (31.4%)
-• PrEP awareness: 1,971 (15.4%)
+    # =============================================================================
+    # SCREENING 2: CONDOM USE DATA
+    # =============================================================================
 
-STI Diagnosis:
-• Any STI: 885 (6.9%)"""
+    y_pos = 11
 
-ax.text(5, y_pos-2.5, characteristics_text, ha='center', va='top', fontsize=10,
-        bbox=dict(boxstyle='round,pad=0.3', facecolor='#F8F9FA', 
-                  edgecolor='#6C757D', linewidth=1.5),
-        color=text_color, linespacing=1.5, family='monospace')
+    # After sexual activity filter
+    boxes.append((5, y_pos, REMAINING1_TEXT, box_text))
 
-# =============================================================================
-# EXCLUSIONS SUMMARY
-# =============================================================================
+    # Arrow down
+    arrows.append(((5, y_pos-0.5), (5, y_pos-1), down_arrow))
 
-y_pos = 0.8
+    # Exclusion box 2
+    boxes.append((8.5, y_pos, EXCLUDE2_TEXT, exclude_text))
 
-# Total exclusions summary
-exclusion_summary = """TOTAL EXCLUSIONS: 7,627 (37.4%)
-• No sexual activity: 7,517 (36.9%)
-• Missing condom data: 110 (0.5%)
-• Missing age: 0 (0.0%)"""
+    # Arrow to exclusion
+    arrows.append(((6, y_pos), (8.5, y_pos), exclude_arrow))
 
-ax.text(5, y_pos, exclusion_summary, ha='center', va='center', fontsize=10,
-        bbox=dict(boxstyle='round,pad=0.2', facecolor='#FFF3CD', 
-                  edgecolor='#856404', linewidth=1.5),
-        color='#856404', fontweight='bold', linespacing=1.5)
+    # =============================================================================
+    # SCREENING 3: AGE DATA
+    # =============================================================================
 
-# =============================================================================
-# TITLE
-# =============================================================================
+    y_pos = 9
 
-fig.suptitle('PRISMA Flow Diagram: Participant Selection for PaperB\nCondom Use Correlates Analysis', 
-             fontsize=16, fontweight='bold', y=0.98, color=text_color)
+    # After condom use filter
+    boxes.append((5, y_pos, REMAINING2_TEXT, box_text))
 
-# Add PRISMA note
-ax.text(5, -0.5, 'Based on PRISMA 2020 guidelines for reporting systematic reviews', 
-        ha='center', va='center', fontsize=9, style='italic', color='#7F8C8D')
+    # Arrow down
+    arrows.append(((5, y_pos-0.5), (5, y_pos-1), down_arrow))
 
-plt.tight_layout()
-plt.savefig('/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/prisma_flowchart.png', 
-            dpi=300, bbox_inches='tight', facecolor='white')
-print("PRISMA diagram saved: /Users/carlosmeyer2/IAS/Analysis/PaperB/Results/prisma_flowchart.png")
+    # Exclusion box 3
+    boxes.append((8.5, y_pos, EXCLUDE3_TEXT, exclude_text))
 
-# =============================================================================
-# CREATE DETAILED VERSION WITH NUMBERS
-# =============================================================================
+    # Arrow to exclusion
+    arrows.append(((6, y_pos), (8.5, y_pos), exclude_arrow))
 
-fig2, ax2 = plt.subplots(figsize=(10, 12))
-ax2.set_xlim(0, 10)
-ax2.set_ylim(0, 14)
-ax2.axis('off')
+    # =============================================================================
+    # FINAL SAMPLE FOR ANALYSIS
+    # =============================================================================
 
-y = 13
+    y_pos = 7
 
-# Enrollment
-ax2.text(5, y, "Total ENSSEX participants\nn = 20,392", ha='center', va='center', 
-         fontsize=12, fontweight='bold', bbox=box_props)
-ax2.annotate('', xy=(5, y-0.8), xytext=(5, y-0.4), arrowprops=arrow_props)
+    # Final analytical sample
+    boxes.append((5, y_pos, FINAL_TEXT,
+                  dict(ha='center', va='center', fontsize=13, fontweight='bold',
+                       bbox=final_props, color='#27AE60')))
 
-y -= 1.5
+    # Arrow down
+    arrows.append(((5, y_pos-0.5), (5, y_pos-1), final_arrow))
 
-# Screen 1
-ax2.text(5, y, "Sexually active in last year\n(P71 > 0)\nn = 12,875 (63.1%)", 
-         ha='center', va='center', fontsize=11, bbox=box_props)
-ax2.text(8.5, y, "Excluded\nn = 7,517\n(36.9%)", ha='center', va='center', 
-         fontsize=10, bbox=exclude_props, color='#C0392B')
-ax2.annotate('', xy=(8.5, y), xytext=(6, y), 
-             arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
-ax2.annotate('', xy=(5, y-0.8), xytext=(5, y-0.4), arrowprops=arrow_props)
+    # =============================================================================
+    # SAMPLE CHARACTERISTICS
+    # =============================================================================
 
-y -= 1.5
+    y_pos = 5
 
-# Screen 2
-ax2.text(5, y, "Valid condom use data\n(P73 = 1, 2, or 3)\nn = 12,765 (62.6%)", 
-         ha='center', va='center', fontsize=11, bbox=box_props)
-ax2.text(8.5, y, "Excluded\nn = 110\n(0.5%)", ha='center', va='center', 
-         fontsize=10, bbox=exclude_props, color='#C0392B')
-ax2.annotate('', xy=(8.5, y), xytext=(6, y), 
-             arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
-ax2.annotate('', xy=(5, y-0.8), xytext=(5, y-0.4), arrowprops=arrow_props)
+    # Sample characteristics box
+    boxes.append((5, y_pos-2.5, CHARACTERISTICS_TEXT,
+                  dict(ha='center', va='top', fontproperties=mono_font,
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='#F8F9FA',
+                                 edgecolor='#6C757D', linewidth=1.5),
+                       color=text_color, linespacing=1.5)))
 
-y -= 1.5
+    # =============================================================================
+    # EXCLUSIONS SUMMARY
+    # =============================================================================
 
-# Screen 3
-ax2.text(5, y, "Valid age data\nn = 12,765 (62.6%)", 
-         ha='center', va='center', fontsize=11, bbox=box_props)
-ax2.text(8.5, y, "Excluded\nn = 0\n(0.0%)", ha='center', va='center', 
-         fontsize=10, bbox=exclude_props, color='#C0392B')
-ax2.annotate('', xy=(8.5, y), xytext=(6, y), 
-             arrowprops=dict(arrowstyle='->', lw=1.5, color='#C0392B'))
-ax2.annotate('', xy=(5, y-0.8), xytext=(5, y-0.4), 
-             arrowprops=dict(arrowstyle='->', lw=3, color='#27AE60'))
+    y_pos = 0.8
 
-y -= 1.5
+    # Total exclusions summary
+    boxes.append((5, y_pos, EXCLUSION_SUMMARY,
+                  dict(ha='center', va='center', fontsize=10,
+                       bbox=dict(boxstyle='round,pad=0.2', facecolor='#FFF3CD',
+                                 edgecolor='#856404', linewidth=1.5),
+                       color='#856404', fontweight='bold', linespacing=1.5)))
 
-# Final
-ax2.text(5, y, "FINAL ANALYTICAL SAMPLE\nn = 12,765\n62.6% retention", 
-         ha='center', va='center', fontsize=13, fontweight='bold', bbox=final_props,
-         color='#27AE60')
+    # =============================================================================
+    # TITLE
+    # =============================================================================
 
-y -= 2
+    fig.suptitle(DETAILED_TITLE,
+                 fontsize=16, fontweight='bold', y=0.98, color=text_color)
 
-# Breakdown by analysis
-breakdown_text = """AVAILABLE DATA FOR ANALYSES:
+    # Add PRISMA note
+    boxes.append((5, -0.5, PRISMA_NOTE,
+                  dict(ha='center', va='center', fontsize=9, style='italic', color='#7F8C8D')))
 
-• Bivariate associations: n = 12,765 (100%)
-• Regression Model 1-2: n = 12,765 (100%)
-• Regression Model 3 (+ STI): n = 12,513 (98.0%)
-• Regression Model 4 (+ PrEP): n = 11,806 (92.5%)
-• Age-stratified models: n = 12,765 (by age group)"""
+    draw_boxes(ax, boxes)
+    draw_arrows(ax, arrows)
 
-ax2.text(5, y, breakdown_text, ha='center', va='center', fontsize=10,
-         bbox=dict(boxstyle='round,pad=0.3', facecolor='#E8F8F5', 
-                   edgecolor='#27AE60', linewidth=1.5),
-         linespacing=1.6, family='monospace')
+    # Margins tight_layout() computed for this layout (fig.subplotpars after it);
+    # bottom leaves room for the PRISMA note below the axes
+    fig.subplots_adjust(left=0.0125, right=0.9875, top=0.94, bottom=0.233)
+    path = OUT_DIR + 'prisma_flowchart.png'
+    save_png(fig, path, DETAILED_BBOX)
+    return path
 
-fig2.suptitle('PaperB Participant Flow: Simplified View', 
-              fontsize=15, fontweight='bold', y=0.97)
 
-plt.tight_layout()
-plt.savefig('/Users/carlosmeyer2/IAS/Analysis/PaperB/Results/prisma_flowchart_simple.png', 
-            dpi=300, bbox_inches='tight', facecolor='white')
-print("Simple PRISMA diagram saved: /Users/carlosmeyer2/IAS/Analysis/PaperB/Results/prisma_flowchart_simple.png")
+# =============================================================================
+# CREATE SIMPLIFIED VERSION
+# =============================================================================
 
-print("\nPRISMA diagrams created successfully!")
-print("  - Detailed version: prisma_flowchart.png")
-print("  - Simple version: prisma_flowchart_simple.png")
+def render_simple():
+    """Draw and save the simplified participant flow; return the PNG path."""
+    fig = Figure(figsize=(10, 12))
+    FigureCanvasAgg(fig)
+    ax2 = fig.add_subplot()
+    ax2.set_xlim(0, 10)
+    ax2.set_ylim(0, 14)
+    ax2.axis('off')
+
+    simple_box_text = dict(ha='center', va='center', fontsize=11, bbox=box_props)
+    simple_exclude_text = dict(ha='center', va='center', fontsize=10, bbox=exclude_props,
+                               color='#C0392B')
+    boxes = []
+    arrows = []
+
+    y = 13
+
+    # Enrollment
+    boxes.append((5, y, SIMPLE_ENROLLMENT_TEXT,
+                  dict(simple_box_text, fontsize=12, fontweight='bold')))
+    arrows.append(((5, y-0.4), (5, y-0.8), down_arrow))
+
+    y -= 1.5
+
+    # Screen 1
+    boxes.append((5, y, SIMPLE_SCREEN1_TEXT,
+                  simple_box_text))
+    boxes.append((8.5, y, SIMPLE_EXCLUDE1_TEXT, simple_exclude_text))
+    arrows.append(((6, y), (8.5, y), exclude_arrow))
+    arrows.append(((5, y-0.4), (5, y-0.8), down_arrow))
+
+    y -= 1.5
+
+    # Screen 2
+    boxes.append((5, y, SIMPLE_SCREEN2_TEXT,
+                  simple_box_text))
+    boxes.append((8.5, y, SIMPLE_EXCLUDE2_TEXT, simple_exclude_text))
+    arrows.append(((6, y), (8.5, y), exclude_arrow))
+    arrows.append(((5, y-0.4), (5, y-0.8), down_arrow))
+
+    y -= 1.5
+
+    # Screen 3
+    boxes.append((5, y, SIMPLE_SCREEN3_TEXT, simple_box_text))
+    boxes.append((8.5, y, SIMPLE_EXCLUDE3_TEXT, simple_exclude_text))
+    arrows.append(((6, y), (8.5, y), exclude_arrow))
+    arrows.append(((5, y-0.4), (5, y-0.8), final_arrow))
+
+    y -= 1.5
+
+    # Final
+    boxes.append((5, y, SIMPLE_FINAL_TEXT,
+                  dict(ha='center', va='center', fontsize=13, fontweight='bold',
+                       bbox=final_props, color='#27AE60')))
+
+    y -= 2
+
+    # Breakdown by analysis
+    boxes.append((5, y, BREAKDOWN_TEXT,
+                  dict(ha='center', va='center', fontproperties=mono_font,
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='#E8F8F5',
+                                 edgecolor='#27AE60', linewidth=1.5),
+                       linespacing=1.6)))
+
+    draw_boxes(ax2, boxes)
+    draw_arrows(ax2, arrows)
+
+    fig.suptitle(SIMPLE_TITLE,
+                 fontsize=15, fontweight='bold', y=0.97)
+
+    # Margins tight_layout() computed for this layout (fig.subplotpars after it)
+    fig.subplots_adjust(left=0.015, right=0.985, top=0.9575, bottom=0.0125)
+    path = OUT_DIR + 'prisma_flowchart_simple.png'
+    save_png(fig, path, SIMPLE_BBOX)
+    return path
+
+
+def main():
+    if not MAKE_SIMPLE:
+        print(f"PRISMA diagram saved: {render_detailed()}")
+    else:
+        # The two diagrams are independent, so render them in separate processes
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            detailed = pool.submit(render_detailed)
+            simple = pool.submit(render_simple)
+            print(f"PRISMA diagram saved: {detailed.result()}")
+            print(f"Simple PRISMA diagram saved: {simple.result()}")
+
+    print("\nPRISMA diagrams created successfully!")
+    print("  - Detailed version: prisma_flowchart.png")
+    if MAKE_SIMPLE:
+        print("  - Simple version: prisma_flowchart_simple.png")
+    else:
+        print("  - Simple version skipped (set PRISMA_SIMPLE=1 to create it)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+PAPER B: RUN ANALYSIS PIPELINE
+================================
+
+Runs data preparation, bivariate associations and regression models in a
+single process. The analytical dataset built by 01_prepare_data.py is passed
+to the later steps in memory, so it is not re-read from disk.
+"""
+
+import importlib
+
+prepare = importlib.import_module('01_prepare_data')
+bivariate = importlib.import_module('02_bivariate_associations')
+regression = importlib.import_module('03_regression_models')
+
+
+if __name__ == '__main__':
+    df = prepare.main()
+    bivariate.main(df)
+    regression.main(df)